@@ -141,6 +141,10 @@ class BatchDimmPowerRequest(BaseModel):
     memspecs: List[MemSpecRequestModel]
 
 
+class BatchDimmPowerResponse(BaseModel):
+    results: List[Dict[str, float]]
+
+
 MAX_DIMM_BATCH = 512
 
 
@@ -298,7 +302,7 @@ async def calculate_dimm_power(request: PowerCalculationRequest):
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
-@app.post("/api/calculate/dimm/batch")
+@app.post("/api/calculate/dimm/batch", response_model=BatchDimmPowerResponse)
 async def calculate_dimm_power_batch(request: BatchDimmPowerRequest):
     if len(request.memspecs) == 0:
         return {"results": []}
@@ -106,13 +106,12 @@ class DIMM:
         if self.component_model is None:
             raise ValueError("component_model is None")
 
-        def add_dicts(d1, d2):
-            keys = set(d1.keys()) | set(d2.keys())
-            return {k: d1.get(k, 0.0) + d2.get(k, 0.0) for k in keys}
-
         # Core power is per-DRAM-device; aggregate over devices on the DIMM.
-        for dram in self.dram_list:
-            self.corepower = add_dicts(self.corepower or {}, dram.compute_core())
+        device_powers = [dram.compute_core() for dram in self.dram_list]
+        core_keys = dict.fromkeys(k for power in device_powers for k in power)
+        self.corepower = {
+            k: sum(power.get(k, 0.0) for power in device_powers) for k in core_keys
+        }
 
         # Interface power is a shared bus/topology property; compute once per DIMM.
         self.interfacepower = self.interface_model.compute(self.memspec, self.workload)
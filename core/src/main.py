@@ -7,8 +7,6 @@ from core_model import DDR5CorePowerModel
 from lpddr5_core_model import LPDDR5CorePowerModel
 from lpddr5_interface_model import LPDDR5InterfacePowerModel
 
-from visualizer import plot_power
-
 def main():
     # get paths to memspec and workload
     import argparse
@@ -63,6 +61,8 @@ def main():
     # Generate visualizations if requested
     if args.plot:
         try:
+            # imported lazily so runs without --plot never pay the matplotlib import
+            from visualizer import plot_power
             plot_power(results, memory_type=memory_type)
         except ImportError as e:
             print(f"\nERROR: Visualization skipped: matplotlib not installed ({e})")
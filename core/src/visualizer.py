@@ -1,8 +1,29 @@
+import matplotlib
+
+# Plots are only ever written to PNG, so skip loading an interactive GUI backend
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.colors import to_rgba_array
 from typing import Dict, Optional
 
 run_id = 1
 
+# Bar palette as RGBA rows
+_PALETTE = to_rgba_array(['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b'])
+_DIMM_TOTAL_COLORS = _PALETTE[[2, 1, 0]]
+
+# Core power components shared by the breakdown and stacked plots
+_CORE_COMPONENT_LABELS = ["PRE_STBY", "ACT_STBY", "ACT/PRE", "READ", "WRITE", "REFRESH"]
+_CORE_COMPONENT_KEYS = [
+    "P_PRE_STBY_core",
+    "P_ACT_STBY_core",
+    "P_ACT_PRE_core",
+    "P_RD_core",
+    "P_WR_core",
+    "P_REF_core",
+]
+
 
 def _detect_memory_type(result: Dict[str, float]) -> str:
     """
@@ -40,6 +61,21 @@ def _get_value(result: Dict[str, float], key: str, prefix: str = "core") -> floa
     return result.get(key, 0.0)
 
 
+def _core_component_values(result: Dict[str, float]) -> np.ndarray:
+    """Look up the core power components once, in _CORE_COMPONENT_KEYS order."""
+    return np.array([_get_value(result, k) for k in _CORE_COMPONENT_KEYS])
+
+
+def _save_and_close(fig, filename: str) -> None:
+    """
+    Save a figure and release it.
+    Each plot owns its Figure, so no pyplot state is shared between plots
+    and repeated runs do not accumulate open figures.
+    """
+    fig.savefig(filename)
+    plt.close(fig)
+
+
 def plot_core_components(result: Dict[str, float], memory_type: Optional[str] = None) -> None:
     """
     Plot the main core power components as a bar chart.
@@ -48,32 +84,15 @@ def plot_core_components(result: Dict[str, float], memory_type: Optional[str] =
     if memory_type is None:
         memory_type = _detect_memory_type(result)
     
-    labels = [
-        "PRE_STBY",
-        "ACT_STBY",
-        "ACT/PRE",
-        "READ",
-        "WRITE",
-        "REFRESH",
-    ]
-    keys = [
-        "P_PRE_STBY_core",
-        "P_ACT_STBY_core",
-        "P_ACT_PRE_core",
-        "P_RD_core",
-        "P_WR_core",
-        "P_REF_core",
-    ]
-    values = [_get_value(result, k) for k in keys]
-
-    plt.figure()
-    plt.bar(labels, values, color='steelblue')
-    plt.ylabel("Power (W)")
-    plt.title(f"{memory_type} Core Power Breakdown by Component")
-    plt.xticks(rotation=30)
-    plt.tight_layout()
+    values = _core_component_values(result)
+
+    fig, ax = plt.subplots(layout="constrained")
+    ax.bar(_CORE_COMPONENT_LABELS, values, color='steelblue')
+    ax.set_ylabel("Power (W)")
+    ax.set_title(f"{memory_type} Core Power Breakdown by Component")
+    ax.tick_params(axis="x", rotation=30)
     filename = f"../visualization/plot1_core_components_run{run_id}.png"
-    plt.savefig(filename)
+    _save_and_close(fig, filename)
     print(f"Saved: {filename}")
 
 
@@ -86,7 +105,7 @@ def plot_rail_breakdown(result: Dict[str, float], memory_type: Optional[str] = N
     if memory_type is None:
         memory_type = _detect_memory_type(result)
     
-    plt.figure()
+    fig, ax = plt.subplots(layout="constrained")
     
     if memory_type == "DDR5":
         labels = ["VDD core", "VPP core", "Total core"]
@@ -97,11 +116,9 @@ def plot_rail_breakdown(result: Dict[str, float], memory_type: Optional[str] = N
             _get_value(result, "P_VPP_core"),
             result.get("P_total_core", 0.0)  # Always unprefixed
         ]
-        colors = ['#1f77b4', '#ff7f0e', '#2ca02c']
-        
-        plt.bar(labels, values, color=colors)
-        plt.ylabel("Power (W)")
-        plt.title("DDR5 Core Power: VDD vs VPP vs Total")
+        ax.bar(labels, values, color=_PALETTE[:3])
+        ax.set_ylabel("Power (W)")
+        ax.set_title("DDR5 Core Power: VDD vs VPP vs Total")
     else:  # LPDDR5
         labels = ["VDD1", "VDD2H", "VDD2L", "VDDQ", "Total"]
         keys = ["P_VDD1", "P_VDD2H", "P_VDD2L", "P_VDDQ", "P_total_core"]
@@ -113,15 +130,12 @@ def plot_rail_breakdown(result: Dict[str, float], memory_type: Optional[str] = N
             _get_value(result, "P_VDDQ"),
             result.get("P_total_core", 0.0)  # Always unprefixed
         ]
-        colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd']
-        
-        plt.bar(labels, values, color=colors)
-        plt.ylabel("Power (W)")
-        plt.title("LPDDR5 Core Power by Rail")
+        ax.bar(labels, values, color=_PALETTE[:5])
+        ax.set_ylabel("Power (W)")
+        ax.set_title("LPDDR5 Core Power by Rail")
     
-    plt.tight_layout()
     filename = f"../visualization/plot2_rail_breakdown_run{run_id}.png"
-    plt.savefig(filename)
+    _save_and_close(fig, filename)
     print(f"Saved: {filename}")
 
 
@@ -133,44 +147,23 @@ def plot_core_power_stacked(result: Dict[str, float], memory_type: Optional[str]
     if memory_type is None:
         memory_type = _detect_memory_type(result)
 
-    # Component order for stacking
-    labels = [
-        "PRE_STBY",
-        "ACT_STBY",
-        "ACT/PRE",
-        "READ",
-        "WRITE",
-        "REFRESH",
-    ]
-
-    keys = [
-        "P_PRE_STBY_core",
-        "P_ACT_STBY_core",
-        "P_ACT_PRE_core",
-        "P_RD_core",
-        "P_WR_core",
-        "P_REF_core",
-    ]
-
-    values = [_get_value(result, k) for k in keys]
+    # Components stack in _CORE_COMPONENT_KEYS order
+    values = _core_component_values(result)
 
     # One bar only (the components stack vertically)
     x = ["Core Power"]
 
-    plt.figure(figsize=(6, 5))
+    fig, ax = plt.subplots(figsize=(6, 5), layout="constrained")
 
-    bottom = 0
-    colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b']
-    for label, value, color in zip(labels, values, colors):
-        plt.bar(x, value, bottom=bottom, label=label, color=color)
-        bottom += value
+    # Draw all segments with a single bar() call; each one starts where the previous ends
+    bottoms = np.concatenate(([0.0], np.cumsum(values)[:-1]))
+    bars = ax.bar(x * len(values), values, bottom=bottoms, color=_PALETTE[:len(values)])
 
-    plt.ylabel("Power (W)")
-    plt.title(f"{memory_type} Core Power Breakdown (Stacked)")
-    plt.legend(loc="upper left", bbox_to_anchor=(1.02, 1.0))
-    plt.tight_layout()
+    ax.set_ylabel("Power (W)")
+    ax.set_title(f"{memory_type} Core Power Breakdown (Stacked)")
+    ax.legend(bars.patches, _CORE_COMPONENT_LABELS, loc="upper left", bbox_to_anchor=(1.02, 1.0))
     filename = f"../visualization/plot3_stacked_run{run_id}.png"
-    plt.savefig(filename)
+    _save_and_close(fig, filename)
     print(f"Saved: {filename}")
 
 
@@ -192,15 +185,12 @@ def plot_dimm_total_breakdown(result: Dict[str, float], memory_type: Optional[st
     
     labels = ["Core", "Interface", "Total"]
     values = [core_total, interface_total, core_total + interface_total]
-    colors = ['#2ca02c', '#ff7f0e', '#1f77b4']
-    
-    plt.figure()
-    plt.bar(labels, values, color=colors)
-    plt.ylabel("Power (W)")
-    plt.title(f"{memory_type} DIMM Total Power Breakdown")
-    plt.tight_layout()
+    fig, ax = plt.subplots(layout="constrained")
+    ax.bar(labels, values, color=_DIMM_TOTAL_COLORS)
+    ax.set_ylabel("Power (W)")
+    ax.set_title(f"{memory_type} DIMM Total Power Breakdown")
     filename = f"../visualization/plot4_dimm_total_run{run_id}.png"
-    plt.savefig(filename)
+    _save_and_close(fig, filename)
     print(f"Saved: {filename}")
 
 
@@ -2,12 +2,27 @@
 Regression test runner for DDR5 power model.
 Runs the verification test suite to validate model outputs and performance.
 """
-import subprocess
+import contextlib
+import io
 import sys
 import os
 import json
+import traceback
 from pathlib import Path
 
+# Add core to path so the verification suite can be imported as verif.verif
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+BASELINE_PATH = Path(__file__).parent / "verif" / "baseline" / "power_output_baseline.json"
+
+
+def load_baseline():
+    """Load the regression baseline, or return None if it has not been created yet."""
+    try:
+        return json.loads(BASELINE_PATH.read_bytes())
+    except FileNotFoundError:
+        return None
+
 
 def run_power_model_tests(empirical_data_path=None, update_baseline=False):
     """
@@ -24,34 +39,49 @@ def run_power_model_tests(empirical_data_path=None, update_baseline=False):
     print("RUNNING DDR5 POWER MODEL REGRESSION TESTS")
     print("=" * 70)
     
-    # Build command to run verification suite
-    verif_path = os.path.join(os.path.dirname(__file__), "verif", "verif.py")
-    cmd = [sys.executable, verif_path]
+    # Build arguments for the verification suite
+    verif_args = []
     
     if update_baseline:
-        cmd.append("--update-baseline")
+        verif_args.append("--update-baseline")
     
     if empirical_data_path and os.path.exists(empirical_data_path):
-        cmd.extend(["--empirical-data", empirical_data_path])
+        verif_args.extend(["--empirical-data", empirical_data_path])
     
-    # Run the verification tests
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True
-    )
+    # Run the suite in this interpreter and capture its output
+    from verif import verif as verif_suite
+    
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            returncode = verif_suite.main(verif_args)
+        except SystemExit as e:
+            # e.g. argparse errors; map the code the way the interpreter would
+            if e.code is None or isinstance(e.code, int):
+                returncode = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+                returncode = 1
+        except Exception:
+            # an uncaught error counts as a failed run
+            traceback.print_exc()
+            returncode = 1
+    
+    result_stdout = stdout.getvalue()
+    result_stderr = stderr.getvalue()
     
     print("\n--- TEST OUTPUT ---")
-    print(result.stdout)
+    print(result_stdout)
     
-    if result.stderr:
+    if result_stderr:
         print("\n--- WARNINGS/ERRORS ---")
-        print(result.stderr)
+        print(result_stderr)
     
     print("\n--- TEST RESULT ---")
-    print(f"Exit code: {result.returncode}")
+    print(f"Exit code: {returncode}")
     
-    success = result.returncode == 0
+    success = returncode == 0
     
     if success:
         print("\n[SUCCESS] ALL TESTS PASSED")
@@ -59,21 +89,19 @@ def run_power_model_tests(empirical_data_path=None, update_baseline=False):
         print("\n[FAILURE] SOME TESTS FAILED")
     
     return {
-        "exit_code": result.returncode,
-        "stdout": result.stdout,
-        "stderr": result.stderr,
+        "exit_code": returncode,
+        "stdout": result_stdout,
+        "stderr": result_stderr,
         "success": success
     }
 
 
 def verify_model_output_exists():
     """Verify that the model baseline was created."""
-    baseline_path = Path(__file__).parent / "verif" / "baseline" / "power_output_baseline.json"
+    baseline_path = BASELINE_PATH
+    baseline = load_baseline()
     
-    if baseline_path.exists():
-        with open(baseline_path, 'r') as f:
-            baseline = json.load(f)
-        
+    if baseline is not None:
         print("\n" + "=" * 70)
         print("MODEL BASELINE VERIFICATION")
         print("=" * 70)
@@ -100,9 +128,9 @@ def compare_model_outputs():
     Compare current model output with baseline.
     This is the regression check for requirement F-02.
     """
-    baseline_path = Path(__file__).parent / "verif" / "baseline" / "power_output_baseline.json"
+    baseline = load_baseline()
     
-    if not baseline_path.exists():
+    if baseline is None:
         print("\n[WARN] No baseline found for comparison")
         return True  # Pass if no baseline exists yet
     
@@ -125,10 +153,6 @@ def compare_model_outputs():
         print(f"\n[ERROR] Failed to run model: {e}")
         return False
     
-    # Load baseline
-    with open(baseline_path, 'r') as f:
-        baseline = json.load(f)
-    
     print("\n" + "=" * 70)
     print("REGRESSION: Comparing Model Output with Baseline")
     print("=" * 70)
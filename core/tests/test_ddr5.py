@@ -100,3 +100,19 @@ class TestDDR5:
         assert "P_total_interface" in result
         assert "P_total" in result
 
+    
+    def test_compute_all_repeatable(self, sample_memspec_path, sample_workload_path):
+        """Test compute_all gives the same result when called twice, with core power summed over devices."""
+        dimm = DIMM.load_specs(str(sample_memspec_path), str(sample_workload_path))
+        
+        first = dimm.compute_all()
+        second = dimm.compute_all()
+        
+        assert first == second
+        
+        # every device shares the memspec/workload, so the DIMM core power is N x one device
+        n_devices = len(dimm.dram_list)
+        device_power = dimm.dram_list[0].compute_core()
+        for key, value in device_power.items():
+            assert second[f"core.{key}"] == pytest.approx(n_devices * value)
+        assert second["P_total_core"] == pytest.approx(n_devices * device_power["P_total_core"])
@@ -0,0 +1,74 @@
+"""
+Unit tests for the HWiNFO CSV power log reader.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add core/verif to path
+core_verif = Path(__file__).parent.parent / "verif"
+sys.path.insert(0, str(core_verif))
+
+from hwinfo import read_power_log, _read_power_column_rows
+
+
+HEADER = "Date,Time,c2,c3,c4,c5,c6,c7,Total Power [W]\n"
+
+
+def _row(power, time="12:00:00"):
+    return f"1.1.2025,{time},0,0,0,0,0,0,{power}\n"
+
+
+class TestReadPowerLog:
+    """Test read_power_log and its row-by-row fallback."""
+
+    @pytest.fixture
+    def write_log(self, tmp_path):
+        """Write CSV text to a temporary log file and return its path."""
+        def write(text):
+            path = tmp_path / "hwinfo.csv"
+            path.write_text(text, encoding="utf-8")
+            return path
+        return write
+
+    def test_clean_log(self, write_log):
+        """Test a well-formed log is read in full with a 2 s time axis."""
+        path = write_log(HEADER + _row(1.5) + _row(2.0) + _row(2.5))
+
+        time_data, power_data = read_power_log(path)
+
+        np.testing.assert_array_equal(power_data, [1.5, 2.0, 2.5])
+        np.testing.assert_array_equal(time_data, [0.0, 2.0, 4.0])
+
+    def test_truncated_last_row(self, write_log):
+        """Test a log cut off mid-row falls back and drops only the short row."""
+        path = write_log(HEADER + _row(1.5) + _row(2.0) + "1.1.2025,12:00:04,0,0")
+
+        time_data, power_data = read_power_log(path)
+
+        np.testing.assert_array_equal(power_data, [1.5, 2.0])
+        np.testing.assert_array_equal(time_data, [0.0, 2.0])
+
+    def test_repeated_header(self, write_log):
+        """Test a header repeated mid-log (restarted logging) is skipped."""
+        path = write_log(HEADER + _row(1.5) + HEADER + _row(2.5))
+
+        _, power_data = read_power_log(path)
+
+        np.testing.assert_array_equal(power_data, [1.5, 2.5])
+
+    @pytest.mark.parametrize("row", [
+        "#1.1.2025,12:00:02,0,0,0,0,0,0,1.75\n",
+        '1.1.2025,"12:00:02, local",0,0,0,0,0,0,1.75\n',
+    ])
+    def test_matches_fallback(self, write_log, row):
+        """Test '#' and quoted commas give the same power column as the csv.reader fallback."""
+        path = write_log(HEADER + _row(1.5) + row)
+
+        _, power_data = read_power_log(path)
+
+        np.testing.assert_array_equal(power_data, [1.5, 1.75])
+        np.testing.assert_array_equal(power_data, _read_power_column_rows(path))
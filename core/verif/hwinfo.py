@@ -0,0 +1,54 @@
+"""
+Reader for HWiNFO CSV power logs
+Shared by the verification suite (verif.py) and the empirical data plotter
+"""
+
+import csv
+import warnings
+import numpy as np
+
+
+def _read_power_column_rows(csv_path):
+    """Row-by-row fallback for logs numpy cannot parse in one go; skips short or non-numeric rows."""
+    def power_values(reader):
+        for row in reader:
+            if len(row) < 9:
+                continue
+
+            try:
+                # Parse power value from column 8 (0-indexed)
+                yield float(row[8].strip())
+            except ValueError:
+                continue
+
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f)
+
+        # Skip header row
+        next(reader, None)
+
+        return np.fromiter(power_values(reader), dtype=np.float64)
+
+
+def read_power_log(csv_path):
+    """
+    Parse a HWiNFO CSV into (time_array, power_array)
+
+    HWiNFO CSV format:
+    - Column 0: Timestamp
+    - Column 8: Memory Power (W) - column for "Total Power"
+    """
+    try:
+        # numpy's C tokenizer reads the power column (column 8, 0-indexed) in one pass
+        with warnings.catch_warnings():
+            # a log with only a header row is reported as empty data, not an error
+            warnings.simplefilter("ignore", UserWarning)
+            power_array = np.loadtxt(csv_path, delimiter=',', skiprows=1, usecols=8, ndmin=1,
+                                     comments=None, quotechar='"', encoding='utf-8')
+    except ValueError:
+        # e.g. a truncated last line or a repeated header from an interrupted log
+        power_array = _read_power_column_rows(csv_path)
+
+    # HWiNFO samples every 2 seconds
+    time_array = np.arange(len(power_array)) * 2.0
+    return time_array, power_array
@@ -21,6 +21,10 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from dimm import DIMM
 
+# Characters replaced when turning field paths into file names; compiled once
+# because sanitize_for_filename runs for every field and sweep point
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9_.-]+")
+
 
 @dataclass
 class PerturbationResult:
@@ -165,7 +169,7 @@ def scaled_value(original: float | int, factor: float) -> float | int:
 
 
 def sanitize_for_filename(text: str) -> str:
-	return re.sub(r"[^A-Za-z0-9_.-]+", "_", text)
+	return _UNSAFE_FILENAME_CHARS.sub("_", text)
 
 
 def format_path(path: Sequence[str]) -> str:
@@ -217,7 +221,7 @@ def save_parameter_plot(
 	x_values = [item.perturbation_percent for item in sorted_results]
 	y_values = [item.perturbed_power for item in sorted_results]
 
-	plt.figure(figsize=(9, 5))
+	plt.figure(figsize=(9, 5), layout="constrained")
 	plt.plot(x_values, y_values, marker="o", linewidth=1.5)
 	plt.axhline(baseline_total, color="gray", linestyle="--", linewidth=1.0)
 	plt.axvline(0.0, color="gray", linestyle=":", linewidth=1.0)
@@ -225,11 +229,10 @@ def save_parameter_plot(
 	plt.xlabel("Perturbation (%)")
 	plt.ylabel("P_total (W)")
 	plt.title(f"P_total sensitivity: {field_name}\\nBaseline P_total = {baseline_total:.6f} W")
-	plt.tight_layout()
 
 	filename = sanitize_for_filename(f"{field_name}.png")
 	output_path = output_dir / filename
-	plt.savefig(output_path, dpi=180)
+	plt.savefig(output_path, dpi=150)
 	plt.close()
 	return output_path
 
@@ -1,10 +1,26 @@
 import subprocess
-import re
 import sys
 import time
-import keyboard
 import os
 
+# RAM configuration of the benchmark machine
+RAM_MT_S = 5600
+RAM_CHANNELS = 2
+RAM_BUS_WIDTH_BITS = 64
+
+def parse_loaded_latency_line(line):
+    """
+    Parse one row of MLC --loaded_latency output.
+    Returns (latency_ns, bandwidth_mb_s) for the zero-delay row ("00000  <latency>  <bandwidth>"), otherwise None.
+    """
+    parts = line.split()
+    if len(parts) < 3 or parts[0] != "00000":
+        return None
+    try:
+        return float(parts[1]), float(parts[2])
+    except ValueError:
+        return None
+
 def run_mlc_test(mlc_path, workload_argument="-W5", duration=30, buffer_size="128m"):
     """
     Triggers Intel MLC and returns the bandwidth in MB/s.
@@ -28,25 +44,25 @@ def run_mlc_test(mlc_path, workload_argument="-W5", duration=30, buffer_size="12
     print("Running MLC command: " + " ".join(cmd))
     
     try:
-        # Run command and capture output
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        output = result.stdout
-
-
-
-        # Regex to find the latency and total bandwidth. 
-        # (00000)    -> Group 1: Matches literal 00000
-        # \s+        -> One or more whitespace characters
-        # ([\d.]+)   -> Group 2: One or more digits or decimal points
-        # \s+        -> More whitespace
-        # ([\d.]+)   -> Group 3: One or more digits or decimal points
-        pattern = r"(00000)\s+([\d.]+)\s+([\d.]+)"
-
-        match = re.search(pattern, output)
+        # Rows are parsed as MLC prints them. stderr shares the stdout pipe so only one pipe
+        # has to be drained; lines other than the result row are kept for diagnostics.
+        # MLC is left to finish on its own (it runs under sudo, and HWiNFO is logging the run).
+        match = None
+        unparsed_lines = []
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1) as proc:
+            for line in proc.stdout:
+                if match is None:
+                    # fixed-format table: look for the zero-delay row
+                    match = parse_loaded_latency_line(line)
+                    if match is None:
+                        unparsed_lines.append(line)
+        output = "".join(unparsed_lines)
+        if proc.returncode != 0:
+            # the end of the merged output is where sudo/MLC report what went wrong
+            raise subprocess.CalledProcessError(proc.returncode, cmd, stderr="".join(unparsed_lines[-20:]))
 
         if match:
-            latency = float(match.group(2))
-            bandwidth = float(match.group(3))
+            latency, bandwidth = match
             print(f"Extracted Latency: {latency} ns")
             print(f"Extracted Bandwidth: {bandwidth} MB/s")
 
@@ -62,11 +78,11 @@ def run_mlc_test(mlc_path, workload_argument="-W5", duration=30, buffer_size="12
         print(f"Error: {mlc_path} not found in path.")
         return None, None
 
-def get_ideal_max_bandwidth(mt_s, channels=2, bus_width_bits=64):
+def get_ideal_max_bandwidth(mt_s, channels=RAM_CHANNELS, bus_width_bits=RAM_BUS_WIDTH_BITS):
     # max bandwidth is MT/s * (bus width in bytes) * number of channels
     return mt_s * (bus_width_bits / 8) * channels
 
-def analyze_system_utilization(mlc_path, ram_mt_s, channels=2):
+def analyze_system_utilization(mlc_path, ram_mt_s=RAM_MT_S, channels=RAM_CHANNELS, workload_argument="-W12", duration=20):
     theo_max = get_ideal_max_bandwidth(ram_mt_s, channels)
     print(f"Theoretical Max Bandwidth: {theo_max:,.2f} MB/s")
     print("-" * 50)
@@ -111,10 +127,10 @@ def analyze_system_utilization(mlc_path, ram_mt_s, channels=2):
         print(f"--> Use this % as input RDsch_percent and/or WRsch_percent in workload.json.")
     """
 
-    rw_latency, rw_bw = run_mlc_test(mlc_path=mlc_path, workload_argument="-W12", duration=20)
+    rw_latency, rw_bw = run_mlc_test(mlc_path=mlc_path, workload_argument=workload_argument, duration=duration)
     if rw_bw:
         util = (rw_bw / theo_max) * 100
-        print(f"RD/WR (4:1) Bandwidth as percentage: {util:.2f}% ({rw_bw:,.2f} MB/s)")
+        print(f"MLC {workload_argument} Bandwidth as percentage: {util:.2f}% ({rw_bw:,.2f} MB/s)")
         print(f"--> Use this % as input RDsch_percent and/or WRsch_percent in workload.json.")
 
 
@@ -125,6 +141,10 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run Intel MLC and log with HWiNFO.")
     parser.add_argument("--mlc-path", type=str,
                        help="Path to the MLC binary, relative to current directory when running.")
+    parser.add_argument("--workload", type=str, default="-W12",
+                       help="MLC traffic type argument, e.g. -R (100%% read), -W2 (2:1 RD/WR), -W5 (1:1 RD/WR), -W12 (4:1 RD/WR). Pass it as --workload=-R since the value starts with a dash. Default: -W12")
+    parser.add_argument("--duration", type=int, default=20,
+                       help="Seconds to run MLC for (allow HWiNFO to stabilize). Default: 20")
     args = parser.parse_args()
 
     if not args.mlc_path:
@@ -134,7 +154,7 @@ if __name__ == "__main__":
     print("Please start HWInfo logging now (shortcut: Ctrl+Shift+L).")
     input("\n>>> Press ENTER once HWInfo logging has started...")
     print("\nRunning MLC tests:")
-    analyze_system_utilization(mlc_path=args.mlc_path, ram_mt_s=5600, channels=2)
+    analyze_system_utilization(mlc_path=args.mlc_path, workload_argument=args.workload, duration=args.duration)
     print("\nPlease stop HWInfo logging now (shortcut: Ctrl+Shift+L).")
     input("\n>>> Press ENTER once HWInfo logging has stopped...")
 
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 def excel_column_to_index(col_label):
@@ -25,11 +26,13 @@ def trim_hwinfo_csv(input_path, output_path, keep_cols=None, keep_rows=None):
         return
     print("Successfully loaded {} with {} columns and {} rows.".format(input_path, len(df.columns), len(df)))
 
-    df_trimmed = df.copy()
+    # the steps below return new frames and leave df itself untouched
+    df_trimmed = df
 
     # optionally drop cols
     if keep_cols:
-        cols_to_drop = []
+        # one flag per column position, True = drop
+        cols_to_drop = np.zeros(len(df.columns), dtype=bool)
 
         # keep_cols is a list of ranges (e.g. [A-C, J-Z]), isolate the columns to drop
 
@@ -39,7 +42,7 @@ def trim_hwinfo_csv(input_path, output_path, keep_cols=None, keep_rows=None):
             # cut from beginning to the first start_col
             if (i == 0 and start_col != 'A'):
                 cut_end_idx = excel_column_to_index(start_col) - 1
-                cols_to_drop.extend(df.columns[0 : cut_end_idx + 1])
+                cols_to_drop[0 : cut_end_idx + 1] = True
 
             # get the first column to cut (end_col + 1)
             cut_start_idx = excel_column_to_index(end_col) + 1
@@ -51,16 +54,17 @@ def trim_hwinfo_csv(input_path, output_path, keep_cols=None, keep_rows=None):
                 # if last interval, cut until the end
                 cut_end_idx = len(df.columns) - 1
 
-            cols_to_drop.extend(df.columns[cut_start_idx : cut_end_idx + 1])
+            cols_to_drop[cut_start_idx : cut_end_idx + 1] = True
             
-        print("cols to drop:", cols_to_drop)
+        print("cols to drop:", list(df.columns[cols_to_drop]))
 
         # 3. Drop cols
-        df_trimmed = df.drop(columns=cols_to_drop)
+        df_trimmed = df.loc[:, ~cols_to_drop]
 
     # 4. Optionally trim rows
     if keep_rows:
-        rows_to_drop = []
+        # one flag per row, True = drop
+        rows_to_drop = np.zeros(len(df_trimmed), dtype=bool)
         # for some reason the header row is not read into df, so index 2 in excel corresponds to index 0
         
         keep_rows_0_indexed = list(map(lambda x: f"{max(int(x.split('-')[0]) - 2, 0)}-{max(int(x.split('-')[1]) - 2, 0)}", keep_rows)) 
@@ -73,7 +77,7 @@ def trim_hwinfo_csv(input_path, output_path, keep_cols=None, keep_rows=None):
 
             if (i == 0 and start_row != 0):
                 cut_end_idx = start_row - 1
-                rows_to_drop.extend(range(0, cut_end_idx + 1))
+                rows_to_drop[0 : cut_end_idx + 1] = True
 
             cut_start_idx = 0 if (end_row == 0) else end_row + 1
             if (i != len(keep_rows) - 1):
@@ -84,10 +88,10 @@ def trim_hwinfo_csv(input_path, output_path, keep_cols=None, keep_rows=None):
                 # if last interval, cut until the end
                 cut_end_idx = len(df_trimmed) - 1
                 print("Last interval, setting cut_end_idx to:", cut_end_idx)
-            rows_to_drop.extend(range(cut_start_idx, cut_end_idx + 1))
+            rows_to_drop[cut_start_idx : cut_end_idx + 1] = True
 
-        print("rows to drop:", rows_to_drop)
-        df_trimmed = df_trimmed.drop(index=rows_to_drop)
+        print("rows to drop:", int(rows_to_drop.sum()))
+        df_trimmed = df_trimmed[~rows_to_drop]
 
     df_trimmed.to_csv(output_path, index=False)
     
@@ -1,8 +1,12 @@
 import os
-import csv
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 
+# Add verif to path for the shared HWiNFO log reader
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'verif'))
+from hwinfo import read_power_log
+
 labels_list = []
 time_data_list = []
 power_data_list = []
@@ -19,40 +23,8 @@ def load_empirical_data(csv_path, plot=False):
     if not os.path.exists(csv_path):
         return None, None
     
-    time_data = []
-    power_data = []
-    
     try:
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            
-            # Skip header row
-            next(reader, None)
-            
-            first_timestamp = None
-            for row in reader:
-                if len(row) < 9:
-                    continue
-                    
-                try:
-                    # Parse timestamp (HWiNFO format: "DD/MM/YYYY HH:MM:SS.mmm")
-                    timestamp_str = row[0].strip()
-                    
-                    # Parse power value from column 8 (0-indexed)
-                    power_str = row[8].strip()
-                    power_w = float(power_str)
-                    
-                    if first_timestamp is None:
-                        first_timestamp = 0
-                        time_data.append(0.0)
-                    else:
-                        # Increment time (HWiNFO samples every 2 seconds)
-                        time_data.append(len(time_data) * 2.0)
-                    
-                    power_data.append(power_w)
-                    
-                except (ValueError, IndexError):
-                    continue
+        time_data, power_data = read_power_log(csv_path)
         
         if (plot):
             # plot the data to verify it looks correct in a bar chart:
@@ -67,7 +39,7 @@ def load_empirical_data(csv_path, plot=False):
             plt.grid(True)
             plt.show()
 
-        return np.array(time_data), np.array(power_data)
+        return time_data, power_data
     
     except Exception as e:
         print(f"Error loading empirical data: {e}")
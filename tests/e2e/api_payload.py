@@ -6,14 +6,17 @@ PR CI runs against a merge with ``main``, where ``MemSpecModel`` includes ``regi
 compatible with the feature branch when attributes are missing (defaults).
 """
 
+from dataclasses import asdict
+
 
 def memspec_obj_to_api_dict(memspec) -> dict:
     arch = memspec.memarchitecturespec
     p = memspec.mempowerspec
     t = memspec.memtimingspec
-    nbr_dbs = getattr(arch, "nbrOfDBs", None)
-    if nbr_dbs is None:
-        nbr_dbs = getattr(arch, "nbrOfBankGroups", 8)
+    memarchitecturespec = asdict(arch)
+    if memarchitecturespec.get("nbrOfDBs") is None:
+        memarchitecturespec["nbrOfDBs"] = getattr(arch, "nbrOfBankGroups", 8)
+    memarchitecturespec["nbrOfDBs"] = int(memarchitecturespec["nbrOfDBs"])
     reg = getattr(memspec, "registered", False)
     if isinstance(reg, bool):
         reg_s = "true" if reg else "false"
@@ -21,19 +24,11 @@ def memspec_obj_to_api_dict(memspec) -> dict:
         reg_s = str(reg)
 
     mt = str(getattr(memspec, "memoryType", "DDR5")).strip().upper()
-    memtimingspec = {
-        "tCK": t.tCK,
-        "RAS": t.RAS,
-        "RCD": t.RCD,
-        "RP": t.RP,
-        "RFC1": t.RFC1,
-        "RFC2": t.RFC2,
-        "RFCsb": t.RFCsb,
-        "REFI": t.REFI,
-    }
+    # optional LPDDR timing fields are included only when the dataclass has them
+    memtimingspec = asdict(t)
     for opt in ("RFCab_ns", "RFCpb_ns", "PBR2PBR_ns", "PBR2ACT_ns"):
-        if hasattr(t, opt):
-            memtimingspec[opt] = float(getattr(t, opt, 0.0))
+        if opt in memtimingspec:
+            memtimingspec[opt] = float(memtimingspec[opt])
 
     if mt in ("LPDDR5", "LPDDR5X"):
         mempowerspec = {
@@ -91,35 +86,11 @@ def memspec_obj_to_api_dict(memspec) -> dict:
         "memoryId": memspec.memoryId,
         "memoryType": memspec.memoryType,
         "registered": reg_s,
-        "memarchitecturespec": {
-            "width": arch.width,
-            "nbrOfBanks": arch.nbrOfBanks,
-            "nbrOfBankGroups": arch.nbrOfBankGroups,
-            "nbrOfRanks": arch.nbrOfRanks,
-            "nbrOfColumns": arch.nbrOfColumns,
-            "nbrOfRows": arch.nbrOfRows,
-            "nbrOfDevices": arch.nbrOfDevices,
-            "nbrOfDBs": int(nbr_dbs),
-            "burstLength": arch.burstLength,
-            "dataRate": arch.dataRate,
-        },
+        "memarchitecturespec": memarchitecturespec,
         "mempowerspec": mempowerspec,
         "memtimingspec": memtimingspec,
     }
 
 
 def workload_obj_to_api_dict(workload) -> dict:
-    return {
-        "BNK_PRE_percent": workload.BNK_PRE_percent,
-        "CKE_LO_PRE_percent": workload.CKE_LO_PRE_percent,
-        "CKE_LO_ACT_percent": workload.CKE_LO_ACT_percent,
-        "PageHit_percent": workload.PageHit_percent,
-        "RDsch_percent": workload.RDsch_percent,
-        "RD_Data_Low_percent": workload.RD_Data_Low_percent,
-        "WRsch_percent": workload.WRsch_percent,
-        "WR_Data_Low_percent": workload.WR_Data_Low_percent,
-        "termRDsch_percent": workload.termRDsch_percent,
-        "termWRsch_percent": workload.termWRsch_percent,
-        "System_tRC_ns": workload.System_tRC_ns,
-        "tRRDsch_ns": workload.tRRDsch_ns,
-    }
+    return asdict(workload)
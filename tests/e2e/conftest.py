@@ -2,6 +2,7 @@
 Pytest fixtures for e2e tests.
 """
 
+import json
 import pytest
 import sys
 from pathlib import Path
@@ -16,37 +17,124 @@ api_path = project_root / "api"
 sys.path.insert(0, str(api_path))
 
 
-@pytest.fixture
-def core_package():
-    """Import core package modules."""
+def pytest_configure(config):
+    # registered here so the mark is known even when pytest-xdist is not installed
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests of one group on the same pytest-xdist worker"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Keep the e2e tests on one pytest-xdist worker under ``-n auto --dist=loadgroup``,
+    so all e2e tests share one session-scoped TestClient and one set of parsed specs.
+    """
+    e2e_dir = Path(__file__).parent
+    for item in items:
+        if e2e_dir in Path(item.fspath).parents:
+            item.add_marker(pytest.mark.xdist_group("e2e_api"))
+
+
+@pytest.fixture(scope="session")
+def api_client():
+    """FastAPI test client shared by the whole session, so the app and its lifespan start once."""
+    from fastapi.testclient import TestClient
+    from main import app
+
+    with TestClient(app) as client:
+        yield client
+
+
+# Core package classes/functions, one fixture each, imported lazily once per session
+
+@pytest.fixture(scope="session")
+def DDR5():
     from ddr5 import DDR5
+    return DDR5
+
+
+@pytest.fixture(scope="session")
+def DDR5CorePowerModel():
     from core_model import DDR5CorePowerModel
+    return DDR5CorePowerModel
+
+
+@pytest.fixture(scope="session")
+def DDR5InterfacePowerModel():
     from interface_model import DDR5InterfacePowerModel
-    from parser import load_memspec, load_workload
-    
-    return {
-        "DDR5": DDR5,
-        "DDR5CorePowerModel": DDR5CorePowerModel,
-        "DDR5InterfacePowerModel": DDR5InterfacePowerModel,
-        "load_memspec": load_memspec,
-        "load_workload": load_workload,
-    }
+    return DDR5InterfacePowerModel
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def load_memspec():
+    from parser import load_memspec
+    return load_memspec
+
+
+@pytest.fixture(scope="session")
+def load_workload():
+    from parser import load_workload
+    return load_workload
+
+
+@pytest.fixture(scope="session")
 def sample_memspec_path():
     """Path to sample memspec file."""
     workloads_dir = project_root / "core" / "workloads"
     return workloads_dir / "micron_16gb_ddr5_4800_x8_spec.json"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_workload_path():
     """Path to sample workload file."""
     workloads_dir = project_root / "core" / "workloads"
     return workloads_dir / "workload.json"
 
 
+@pytest.fixture(scope="session")
+def loaded_specs(load_memspec, load_workload, sample_memspec_path, sample_workload_path):
+    """Sample (memspec, workload) parsed once per session; tests must not mutate them."""
+    memspec = load_memspec(str(sample_memspec_path))
+    workload = load_workload(str(sample_workload_path))
+    return memspec, workload
+
+
+@pytest.fixture(scope="session")
+def core_result(DDR5, DDR5CorePowerModel, loaded_specs):
+    """DDR5 compute_core() output for the sample memspec/workload, computed once per session."""
+    memspec, workload = loaded_specs
+    ddr5 = DDR5(memspec, workload, core_model=DDR5CorePowerModel())
+    return ddr5.compute_core()
+
+
+@pytest.fixture(scope="session")
+def request_payload(loaded_specs):
+    """Calculate-route request body for the sample memspec/workload, built once per session."""
+    from .api_payload import memspec_obj_to_api_dict, workload_obj_to_api_dict
+
+    memspec, workload = loaded_specs
+    return {
+        "memspec": memspec_obj_to_api_dict(memspec),
+        "workload": workload_obj_to_api_dict(workload),
+    }
+
+
+@pytest.fixture(scope="session")
+def request_payload_body(request_payload):
+    """request_payload JSON-encoded once, for posting with content= and a JSON content-type."""
+    return json.dumps(request_payload).encode()
+
+
+@pytest.fixture(scope="session")
+def core_api_response(api_client, request_payload_body):
+    """Response of /api/calculate/core for request_payload, posted once per session."""
+    return api_client.post(
+        "/api/calculate/core",
+        content=request_payload_body,
+        headers={"content-type": "application/json"},
+    )
+
+
 @pytest.fixture
 def api_compatible_memspec():
     """Payload for calculate routes; includes fields required on main (registered, nbrOfDBs)."""
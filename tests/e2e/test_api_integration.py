@@ -3,110 +3,101 @@ Tests for API integration with core package.
 """
 
 import copy
+import json
 
 import pytest
-from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
 
-# Add api to path (main.py is in api/)
-project_root = Path(__file__).parent.parent.parent
-api_path = project_root / "api"
-sys.path.insert(0, str(api_path))
+# core/src and api/ are put on sys.path by conftest.py; the app itself is
+# imported lazily by the session-scoped api_client fixture
 
-# Import will be done in test functions
+# Minimal valid calculate-route body, encoded once and posted to every endpoint
+MINIMAL_REQUEST = {
+    "memspec": {
+        "memoryId": "test",
+        "memoryType": "DDR5",
+        "registered": "false",
+        "memarchitecturespec": {
+            "width": 8,
+            "nbrOfBanks": 16,
+            "nbrOfBankGroups": 8,
+            "nbrOfRanks": 1,
+            "nbrOfColumns": 1024,
+            "nbrOfRows": 65536,
+            "nbrOfDevices": 1,
+            "nbrOfDBs": 8,
+            "burstLength": 16,
+            "dataRate": 2
+        },
+        "mempowerspec": {
+            "vdd": 1.1, "vpp": 1.8, "vddq": 1.1,
+            "idd0": 50.0, "idd2n": 46.0, "idd3n": 105.0,
+            "idd4r": 210.0, "idd4w": 245.0, "idd5b": 10500.0,
+            "idd6n": 46.0, "idd2p": 43.0, "idd3p": 102.0,
+            "ipp0": 5.0, "ipp2n": 4.5, "ipp3n": 10.0,
+            "ipp4r": 20.0, "ipp4w": 25.0, "ipp5b": 1000.0,
+            "ipp6n": 4.5, "ipp2p": 4.0, "ipp3p": 9.5
+        },
+        "memtimingspec": {
+            "tCK": 0.416e-9, "RAS": 28, "RCD": 28, "RP": 14,
+            "RFC1": 350, "RFC2": 260, "RFCsb": 140, "REFI": 7800
+        }
+    },
+    "workload": {
+        "BNK_PRE_percent": 50.0,
+        "CKE_LO_PRE_percent": 0.0,
+        "CKE_LO_ACT_percent": 0.0,
+        "PageHit_percent": 50.0,
+        "RDsch_percent": 50.0,
+        "RD_Data_Low_percent": 25.0,
+        "WRsch_percent": 50.0,
+        "WR_Data_Low_percent": 25.0,
+        "termRDsch_percent": 50.0,
+        "termWRsch_percent": 50.0,
+        "System_tRC_ns": 46.0,
+        "tRRDsch_ns": 4.0
+    }
+}
+MINIMAL_REQUEST_BODY = json.dumps(MINIMAL_REQUEST).encode()
 
 
 class TestAPIIntegration:
     """Test API integration with core package."""
     
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        from main import app
-        return TestClient(app)
-    
-    def test_api_health(self, client):
+    def test_api_health(self, api_client):
         """Test API health endpoints."""
-        response = client.get("/")
+        response = api_client.get("/")
         assert response.status_code == 200
 
-        response = client.get("/health")
+        response = api_client.get("/health")
         assert response.status_code == 200
         assert response.json()["status"] == "healthy"
 
-        r2 = client.get("/api/health")
+        r2 = api_client.get("/api/health")
         assert r2.status_code == 200
         assert r2.json()["status"] == "healthy"
     
-    def test_all_endpoints_exist(self, client):
+    @pytest.mark.parametrize("endpoint", [
+        "/api/calculate/core",
+        "/api/calculate/interface",
+        "/api/calculate/all",
+        "/api/calculate/dimm",
+    ])
+    def test_all_endpoints_exist(self, api_client, endpoint):
         """Test that all API endpoints are accessible."""
-        # Use minimal valid data
-        minimal_request = {
-            "memspec": {
-                "memoryId": "test",
-                "memoryType": "DDR5",
-                "registered": "false",
-                "memarchitecturespec": {
-                    "width": 8,
-                    "nbrOfBanks": 16,
-                    "nbrOfBankGroups": 8,
-                    "nbrOfRanks": 1,
-                    "nbrOfColumns": 1024,
-                    "nbrOfRows": 65536,
-                    "nbrOfDevices": 1,
-                    "nbrOfDBs": 8,
-                    "burstLength": 16,
-                    "dataRate": 2
-                },
-                "mempowerspec": {
-                    "vdd": 1.1, "vpp": 1.8, "vddq": 1.1,
-                    "idd0": 50.0, "idd2n": 46.0, "idd3n": 105.0,
-                    "idd4r": 210.0, "idd4w": 245.0, "idd5b": 10500.0,
-                    "idd6n": 46.0, "idd2p": 43.0, "idd3p": 102.0,
-                    "ipp0": 5.0, "ipp2n": 4.5, "ipp3n": 10.0,
-                    "ipp4r": 20.0, "ipp4w": 25.0, "ipp5b": 1000.0,
-                    "ipp6n": 4.5, "ipp2p": 4.0, "ipp3p": 9.5
-                },
-                "memtimingspec": {
-                    "tCK": 0.416e-9, "RAS": 28, "RCD": 28, "RP": 14,
-                    "RFC1": 350, "RFC2": 260, "RFCsb": 140, "REFI": 7800
-                }
-            },
-            "workload": {
-                "BNK_PRE_percent": 50.0,
-                "CKE_LO_PRE_percent": 0.0,
-                "CKE_LO_ACT_percent": 0.0,
-                "PageHit_percent": 50.0,
-                "RDsch_percent": 50.0,
-                "RD_Data_Low_percent": 25.0,
-                "WRsch_percent": 50.0,
-                "WR_Data_Low_percent": 25.0,
-                "termRDsch_percent": 50.0,
-                "termWRsch_percent": 50.0,
-                "System_tRC_ns": 46.0,
-                "tRRDsch_ns": 4.0
-            }
-        }
-        
-        endpoints = [
-            "/api/calculate/core",
-            "/api/calculate/interface",
-            "/api/calculate/all",
-            "/api/calculate/dimm",
-        ]
-
-        for endpoint in endpoints:
-            response = client.post(endpoint, json=minimal_request)
-            assert response.status_code == 200, f"Endpoint {endpoint} failed"
-            assert response.json() is not None
+        response = api_client.post(
+            endpoint,
+            content=MINIMAL_REQUEST_BODY,
+            headers={"content-type": "application/json"},
+        )
+        assert response.status_code == 200, f"Endpoint {endpoint} failed"
+        assert response.json() is not None
 
     def test_dimm_batch_endpoint_matches_single_dimm_totals(
-        self, client, api_compatible_memspec, api_compatible_workload
+        self, api_client, api_compatible_memspec, api_compatible_workload
     ):
         """Batch route used by inverse search; totals should match single /dimm for same memspec."""
         minimal_request = {"memspec": api_compatible_memspec, "workload": api_compatible_workload}
-        single = client.post("/api/calculate/dimm", json=minimal_request)
+        single = api_client.post("/api/calculate/dimm", json=minimal_request)
         assert single.status_code == 200, single.text
         one = single.json()
         mem_a = copy.deepcopy(api_compatible_memspec)
@@ -115,7 +106,7 @@ class TestAPIIntegration:
             "workload": copy.deepcopy(api_compatible_workload),
             "memspecs": [mem_a, mem_b],
         }
-        batch = client.post("/api/calculate/dimm/batch", json=batch_body)
+        batch = api_client.post("/api/calculate/dimm/batch", json=batch_body)
         assert batch.status_code == 200, batch.text
         body = batch.json()
         assert "results" in body and len(body["results"]) == 2
@@ -124,11 +115,11 @@ class TestAPIIntegration:
             assert row["P_total"] == pytest.approx(one["P_total"], rel=1e-9, abs=1e-12)
 
     def test_lpddr_calculate_dimm_smoke(
-        self, client, api_compatible_lpddr_memspec, api_compatible_workload
+        self, api_client, api_compatible_lpddr_memspec, api_compatible_workload
     ):
         """LPDDR5X /dimm returns LPDDR rail keys on core.* (not DDR5 VDD/VPP-only)."""
         req = {"memspec": api_compatible_lpddr_memspec, "workload": api_compatible_workload}
-        r = client.post("/api/calculate/dimm", json=req)
+        r = api_client.post("/api/calculate/dimm", json=req)
         assert r.status_code == 200, r.text
         j = r.json()
         assert "core.P_VDD2H" in j